@@ -9,4 +9,7 @@ def init() -> None:
     from .utils import BotUtils
 
     BotManager.GUILD_INFOS = cfg["discord"]["guilds"]
-    BotUtils.GUILD_INFOS = cfg["discord"]["guilds"]
+    BotUtils.CONFIG_GUILD_IDS = {
+        guild_info["config_channel"]: guild_info["guild_id"]
+        for guild_info in cfg["discord"]["guilds"]
+    }
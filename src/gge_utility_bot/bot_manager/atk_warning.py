@@ -28,19 +28,13 @@ class AtkWarningRouter:
         :rtype: set[int]
         """
         routes = await self._get_atk_listener_routes(routing_info)
-        channel_ids: set[int] = set()
-
-        # Update channel_ids with all valid channels
-        # for every route_channels
-        channel_ids.update(
-            *(await asyncio.gather(
-                *[
-                    self._get_valid_channels(route_channels)
-                    for route_channels in routes
-                ],
-            )),
-        )
-        return channel_ids
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._get_valid_channels(route_channels))
+                for route_channels in routes
+            ]
+        # Combine all valid channels for every route_channels
+        return set().union(*(task.result() for task in tasks))
 
     async def _get_atk_listener_routes(
         self,
@@ -55,19 +49,21 @@ class AtkWarningRouter:
         :return: A list of routing information for each guild
         :rtype: list[RouteChannels]
         """
-        # Using asyncio.gather here to allow faster reads
-        results = await asyncio.gather(
-            *[
-                self._get_guild_atk_listener_routes(
+        # Skip duplicated guild ids to avoid repeated reads
+        unique_guild_ids = set(routing_info["routes"])
+
+        # Using concurrent tasks here to allow faster reads
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._get_guild_atk_listener_routes(
                     guild_id, routing_info,
-                )
-                for guild_id in routing_info["routes"]
-            ],
-        )
+                ))
+                for guild_id in unique_guild_ids
+            ]
         # Only include the ones that succeeded
         return [
-            route_channels for route_channels in results
-            if route_channels is not None
+            route_channels for task in tasks
+            if (route_channels := task.result()) is not None
         ]
 
     async def _get_guild_atk_listener_routes(
@@ -109,7 +105,7 @@ class AtkWarningRouter:
                 dict[str, GuildAttackListenerRoutingConfigType],
             ):
                 return
-        except:
+        except Exception:
             return
 
         return {
@@ -177,19 +173,21 @@ class AtkWarningRouter:
         channel_ids = route_channels["channel_ids"]
 
         # Get the id of the guild where each channel is in
-        channel_guild_ids = await asyncio.gather(
-            *[
-                self._bot_utils.get_channel_guild_id(channel_id)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    self._bot_utils.get_channel_guild_id(channel_id),
+                )
                 for channel_id in channel_ids
-            ],
-        )
+            ]
+        channel_guild_ids = [task.result() for task in tasks]
         # Find all channels that is in the guild with
         # the given guild id
-        valid_channel_ids: set[int] = set([
+        valid_channel_ids: set[int] = {
             channel_id
             for channel_id, channel_guild_id in zip(
                 channel_ids, channel_guild_ids,
             )
             if channel_guild_id == guild_id
-        ])
+        }
         return valid_channel_ids
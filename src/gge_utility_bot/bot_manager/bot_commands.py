@@ -1,3 +1,6 @@
+import io
+import time
+
 import discord
 from discord import app_commands
 from typing_extensions import AsyncGenerator
@@ -24,6 +27,12 @@ class ConfigCommandGroup(
         self._bot_utils = bot_utils
         self._config_manager = config_manager
 
+        # Last serialized config of each guild, keyed by guild id,
+        # stored as (config version, path, expiry, serialized config)
+        self._display_cache: dict[
+            int, tuple[int, str, float, bytes],
+        ] = {}
+
         self.get_config.autocomplete("path")(
             self._path_autocomplete,
         )
@@ -53,22 +62,18 @@ class ConfigCommandGroup(
             )
             return
 
-        try:
-            config = await self._config_manager.get(guild_id, path)
-        except ConfigManager.InvalidPathError:
+        config_bytes = await self._get_display_config(guild_id, path)
+        if config_bytes is None:
             await interaction.followup.send(
                 MESSAGES.config.get.bad_path,
                 ephemeral=True,
             )
             return
 
-        # Serialize config for display
-        # JSON serialization should work since the write operation
-        # uses JSON deserialization
-        buffer = utils.serialize_as_display_buffer(
-            config, sort_keys=True,
+        # A new buffer is required since discord.File consumes it
+        file = discord.File(
+            io.BytesIO(config_bytes), filename="config.json",
         )
-        file = discord.File(buffer, filename="config.json")
 
         # Send config as json file
         await interaction.followup.send(
@@ -145,6 +150,56 @@ class ConfigCommandGroup(
                 MESSAGES.config.remove.failed,
             )
 
+    async def _get_display_config(
+        self,
+        guild_id: int,
+        path: str,
+    ) -> bytes | None:
+        """
+        Get the configuration at the specified path serialized for
+        display. The result is reused until the configuration of
+        the guild is modified.
+
+        :param guild_id: The id of the guild
+        :type guild_id: int
+        :param path: The path to the configuration
+        :type path: str
+        :return: None if the path is invalid, the serialized
+            configuration otherwise
+        :rtype: bytes | None
+        """
+        # Read version before the config so that a concurrent write
+        # invalidates the result
+        version = self._config_manager.get_version(guild_id)
+        cached = self._display_cache.get(guild_id)
+        if (
+            cached is not None
+            and cached[:2] == (version, path)
+            # Expire like ConfigManager's cache to pick up changes
+            # made outside of this process
+            and time.monotonic() < cached[2]
+        ):
+            return cached[3]
+
+        try:
+            config = await self._config_manager.get(guild_id, path)
+        except ConfigManager.InvalidPathError:
+            return
+
+        # Serialize config for display
+        # JSON serialization should work since the write operation
+        # uses JSON deserialization
+        config_bytes = utils.serialize_as_display_bytes(
+            config, sort_keys=True,
+        )
+        self._display_cache[guild_id] = (
+            version,
+            path,
+            time.monotonic() + ConfigManager.CACHE_TTL,
+            config_bytes,
+        )
+        return config_bytes
+
     def _get_target_guild_id(
         self,
         interaction: discord.Interaction,
@@ -223,8 +278,8 @@ class ConfigCommandGroup(
             configuration
         :rtype: Iterator[AsyncGenerator[str]]
         """
-        index = path.rfind(".")
-        dir_path = path[:index] if index != -1 else ""
+        # dir_path is empty if there is no separator
+        dir_path, _, _ = path.rpartition(".")
         try:
             dir_value = await self._config_manager.get(
                 guild_id, dir_path,
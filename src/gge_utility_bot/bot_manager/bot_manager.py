@@ -22,6 +22,9 @@ logger = logging.getLogger(__name__)
 
 class BotManager:
     GUILD_INFOS: list[GuildInfoConfigType]
+    SEND_QUEUE_MAX_SIZE: int = 1024
+    # Warn when the send queue is 80% full
+    SEND_QUEUE_WARNING_SIZE: int = SEND_QUEUE_MAX_SIZE * 4 // 5
 
     def __init__(
         self,
@@ -30,11 +33,13 @@ class BotManager:
         attack_listener: AttackListener,
         status_monitor: StatusMonitor,
         config_manager: ConfigManager,
+        send_workers: int = 8,
     ) -> None:
         self._bot = bot
         self._atk_listener = attack_listener
         self._status_monitor = status_monitor
         self._config_manager = config_manager
+        self._send_workers = send_workers
 
         self._bot_utils = BotUtils(self._bot)
 
@@ -60,10 +65,23 @@ class BotManager:
             self._msg_callback_manager.on_event,
             "on_message",
         )
+        self._bot.add_listener(
+            self._bot_utils.invalidate_channel,
+            "on_guild_channel_delete",
+        )
+        self._bot.add_listener(
+            self._bot_utils.invalidate_channel,
+            "on_guild_channel_update",
+        )
+        self._bot.add_listener(
+            self._bot_utils.invalidate_channel_cache,
+            "on_guild_remove",
+        )
         self._load_bot_commands()
 
+        # Bounded to apply backpressure on message producers
         self._send_queue: asyncio.Queue[tuple[str, int]] = (
-            asyncio.Queue()
+            asyncio.Queue(maxsize=self.SEND_QUEUE_MAX_SIZE)
         )
 
     async def start(self, token: str) -> None:
@@ -75,6 +93,13 @@ class BotManager:
     async def send_msg(self, msg: str, channel_id: int) -> None:
         await self._send_queue.put((msg, channel_id))
 
+        # Only warn when the threshold is reached to avoid spamming
+        if self._send_queue.qsize() == self.SEND_QUEUE_WARNING_SIZE:
+            logger.warning(
+                "Send queue is nearly full, "
+                f"{self.SEND_QUEUE_WARNING_SIZE} messages pending.",
+            )
+
     async def _on_ready(self) -> None:
         await self._bot.tree.sync()
 
@@ -97,38 +122,35 @@ class BotManager:
         """
         Starts all tasks related to the bot's life cycle.
         """
-        bg_msg_coro = self._bg_msg_loop()
-        atk_warning_coro = self._atk_warning_loop()
-
-        all_coros = [
-            bg_msg_coro,
-            atk_warning_coro,
-        ]
-        # Wait for all task to complete
-        try:
-            await asyncio.gather(
-                *all_coros,
-                return_exceptions=True,
-            )
-        except asyncio.CancelledError:
-            await asyncio.gather(
-                *all_coros,
-                return_exceptions=True,
-            )
+        # Tasks are cancelled together when this task is cancelled
+        async with asyncio.TaskGroup() as tg:
+            # Multiple workers so that sending to different channels
+            # can overlap, discord.py handles rate limits per channel
+            for _ in range(self._send_workers):
+                tg.create_task(self._bg_msg_loop())
+            tg.create_task(self._atk_warning_loop())
 
     async def _bg_msg_loop(self) -> None:
         while not self._bot.is_closed():
             msg, channel_id = await self._send_queue.get()
-            await self._send_msg(msg, channel_id)
+            try:
+                await self._send_msg(msg, channel_id)
+            except Exception as e:
+                # Keep the worker alive for other messages
+                logger.exception(f"Error sending message: {e}")
 
     async def _atk_warning_loop(self) -> None:
         while True:
             routing_info, atk_warnings = (
                 await self._atk_listener.get()
             )
-            channel_ids = await (
-                self._atk_warning_router.get_route(routing_info)
-            )
+            try:
+                channel_ids = await (
+                    self._atk_warning_router.get_route(routing_info)
+                )
+            except Exception as e:
+                logger.exception(f"Error routing attack warnings: {e}")
+                continue
             for msg in atk_warnings:
                 for channel_id in channel_ids:
                     await self.send_msg(msg, channel_id)
@@ -1,10 +1,11 @@
 import io
 
 import discord
+from typing_extensions import Any
 
 from gge_utility_bot.bot_services import (
     ConfigManager,
-    summarize_battle_report,
+    summarize_battle_report_async,
 )
 from gge_utility_bot.messages import MESSAGES
 
@@ -27,35 +28,44 @@ class MessageCallbacks:
         :param message: The message object to be used
         :type message: discord.Message
         """
-        is_battle_report = await self._is_battle_report_msg(message)
-        if not is_battle_report:
-            return
-
         if message.guild is None:
             return
+        # Most messages have no images, skip reading the config
+        if not any(
+            self._is_image(attachment)
+            for attachment in message.attachments
+        ):
+            return
         guild_id = message.guild.id
 
         try:
-            summary_enabled = await self._config_manager.get(
+            # Read the whole service configuration at once instead
+            # of reading each field separately
+            battle_report_config = await self._config_manager.get(
                 guild_id,
-                "services.battle_report.summary.enabled",
+                "services.battle_report",
             )
-            # summary enabled MUST be True
-            if summary_enabled is not True:
-                return
-        except:
+        except ConfigManager.InvalidPathError:
+            return
+
+        # Check if message is from a battle report channel
+        if not self._is_battle_report_channel(
+            message.channel.id, battle_report_config,
+        ):
+            return
+        # summary enabled MUST be True
+        if not self._is_summary_enabled(battle_report_config):
             return
 
         for attachment in message.attachments:
             if not self._is_image(attachment):
                 continue
 
-            # Save image file to buffer
-            buffer = io.BytesIO()
-            await attachment.save(buffer, seek_begin=True)
+            # Wrapping the downloaded bytes does not copy them
+            buffer = io.BytesIO(await attachment.read())
 
             # Summarize battle report image
-            out_buffer = summarize_battle_report(buffer)
+            out_buffer = await summarize_battle_report_async(buffer)
             if out_buffer is None:
                 continue
 
@@ -65,46 +75,49 @@ class MessageCallbacks:
                 mention_author=False,
             )
 
-    async def _is_battle_report_msg(
+    def _is_battle_report_channel(
         self,
-        message: discord.Message,
+        channel_id: int,
+        battle_report_config: Any,
     ) -> bool:
         """
-        Check if the message is a battle report message.
-
-        :param message: The message object
-        :type message: discord.Message
-        :return: True if the message is a battle report message,
+        Check if the channel is configured as a battle report
+        channel.
+
+        :param channel_id: The id of the channel
+        :type channel_id: int
+        :param battle_report_config: The battle report configuration
+            of the guild
+        :type battle_report_config: Any
+        :return: True if the channel is a battle report channel,
             False otherwise
         :rtype: bool
         """
-        if message.guild is None:
+        if not isinstance(battle_report_config, dict):
             return False
-        guild_id = message.guild.id
-        channel_id = message.channel.id
-        attachments = message.attachments
-
-        try:
-            # Check if message is from a battle report channel
-            channel_ids = await self._config_manager.get(
-                guild_id,
-                "services.battle_report.channel_ids",
-            )
-            if not isinstance(channel_ids, dict):
-                return False
-            if channel_id not in channel_ids.values():
-                return False
-        except:
+        channel_ids = battle_report_config.get("channel_ids")
+        if not isinstance(channel_ids, dict):
             return False
 
-        # Check if there are image attachments
-        for attachment in attachments:
-            if self._is_image(attachment):
-                break
-        else:
+        return channel_id in channel_ids.values()
+
+    def _is_summary_enabled(self, battle_report_config: Any) -> bool:
+        """
+        Check if battle report summary is enabled.
+
+        :param battle_report_config: The battle report configuration
+            of the guild
+        :type battle_report_config: Any
+        :return: True if summary is enabled, False otherwise
+        :rtype: bool
+        """
+        if not isinstance(battle_report_config, dict):
+            return False
+        summary_config = battle_report_config.get("summary")
+        if not isinstance(summary_config, dict):
             return False
 
-        return True
+        return summary_config.get("enabled") is True
 
     def _is_image(self, attachment: discord.Attachment) -> bool:
         """
@@ -1,18 +1,31 @@
 import json
+import time
 
 import discord
 from discord.ext import commands
 from typing_extensions import Any, AsyncGenerator, Union
 
-from gge_utility_bot.config import GuildInfoConfigType
-
 
 class BotUtils:
-    GUILD_INFOS: list[GuildInfoConfigType]
+    __slots__ = ("_bot", "_failed_channel_ids", "_channel_guild_ids")
+
+    CONFIG_GUILD_IDS: dict[int, int]  # Config channel id to guild id
+    # Duration to skip fetching channels that are not accessible
+    FAILED_CHANNEL_TTL: float = 5
+    FAILED_CHANNEL_IDS_MAX_LEN: int = 4096
+    CHANNEL_GUILD_IDS_MAX_LEN: int = 4096
 
     def __init__(self, bot: commands.Bot) -> None:
         self._bot = bot
 
+        # Maps channel id to expiry time of a failed fetch
+        self._failed_channel_ids: dict[int, float] = {}
+
+        # Channel to guild mapping never changes for a channel, so
+        # found guild ids are kept. Failed lookups are not kept since
+        # the channel may become accessible later.
+        self._channel_guild_ids: dict[int, int] = {}
+
     async def get_channel(
         self,
         channel_id: int,
@@ -45,14 +58,33 @@ class BotUtils:
         ]
         """
         channel = self._bot.get_channel(channel_id)
-        if channel is None:
-            # Not available in cache, fetch from discord API instead
-            try:
-                channel = await self._bot.fetch_channel(channel_id)
-            except:
+        if channel is not None:
+            return channel
+
+        # Avoid repeated requests for inaccessible channels
+        now = time.monotonic()
+        expiry = self._failed_channel_ids.get(channel_id)
+        if expiry is not None:
+            if now < expiry:
                 return
-
-        return channel
+            del self._failed_channel_ids[channel_id]
+
+        # Not available in cache, fetch from discord API instead
+        try:
+            return await self._bot.fetch_channel(channel_id)
+        except (discord.HTTPException, discord.InvalidData):
+            self._failed_channel_ids[channel_id] = (
+                now + self.FAILED_CHANNEL_TTL
+            )
+            # Remove the oldest entry
+            if (
+                len(self._failed_channel_ids)
+                > self.FAILED_CHANNEL_IDS_MAX_LEN
+            ):
+                del self._failed_channel_ids[
+                    next(iter(self._failed_channel_ids))
+                ]
+            return
 
     async def get_channel_guild_id(
         self,
@@ -69,13 +101,47 @@ class BotUtils:
             the channel belongs to otherwise
         :rtype: int | None
         """
+        guild_id = self._channel_guild_ids.get(channel_id)
+        if guild_id is not None:
+            return guild_id
+
+        # Not available in cache, may require fetching the channel
         channel = await self.get_channel(channel_id)
         if isinstance(channel, (discord.abc.PrivateChannel)):
             return
         if channel is None:
             return
 
-        return channel.guild.id
+        guild_id = channel.guild.id
+        self._channel_guild_ids[channel_id] = guild_id
+        # Remove the oldest entry
+        if len(self._channel_guild_ids) > self.CHANNEL_GUILD_IDS_MAX_LEN:
+            del self._channel_guild_ids[next(iter(self._channel_guild_ids))]
+        return guild_id
+
+    async def invalidate_channel_cache(self, *_: Any) -> None:
+        """
+        Clear all cached channel information. Used as a listener for
+        events that may affect many channels.
+        """
+        self._failed_channel_ids.clear()
+        self._channel_guild_ids.clear()
+
+    async def invalidate_channel(
+        self,
+        channel: discord.abc.GuildChannel,
+        *_: Any,
+    ) -> None:
+        """
+        Remove cached information of a single channel. Used as a
+        listener for events that change a channel.
+
+        :param channel: The changed channel, or the channel before
+            the change for update events
+        :type channel: discord.abc.GuildChannel
+        """
+        self._failed_channel_ids.pop(channel.id, None)
+        self._channel_guild_ids.pop(channel.id, None)
 
     def get_config_guild_id(
         self,
@@ -92,9 +158,7 @@ class BotUtils:
             otherwise
         :rtype: int | None
         """
-        for guild_info in self.GUILD_INFOS:
-            if guild_info["config_channel"] == config_channel_id:
-                return guild_info["guild_id"]
+        return self.CONFIG_GUILD_IDS.get(config_channel_id)
 
 
 def user_input_to_obj(value: str) -> Any:
@@ -109,5 +173,5 @@ def user_input_to_obj(value: str) -> Any:
     """
     try:
         return json.loads(value)
-    except:
+    except (json.JSONDecodeError, RecursionError):
         raise ValueError
@@ -1,5 +1,8 @@
 from .attack_listener import AttackListener, RoutingInfo
 from .battle_report import summarize as summarize_battle_report
+from .battle_report import (
+    summarize_async as summarize_battle_report_async,
+)
 from .config_manager import ConfigManager
 from .status_monitor import StatusMonitor
 
@@ -10,6 +13,7 @@ __all__ = [
     "RoutingInfo",
     "StatusMonitor",
     "summarize_battle_report",
+    "summarize_battle_report_async",
 ]
 
 
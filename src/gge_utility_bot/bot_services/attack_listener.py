@@ -1,12 +1,13 @@
 import asyncio
 import logging
+import random
+from collections import Counter, OrderedDict
 
 from typing_extensions import TypedDict
 
 from gge_utility_bot import data_process as dp
 from gge_utility_bot.config import PlayerConfigType
 from gge_utility_bot.server_comm import ResponseContentType, ServerComm
-from gge_utility_bot.utils import validate_type
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +15,16 @@ logger = logging.getLogger(__name__)
 class RoutingInfo(TypedDict):
     username: str
     server: str
-    routes: list[int]
+    routes: tuple[int, ...]  # Guild ids, may contain duplicates
 
 
 class AttackListener:
     REQUEST_COOLDOWN: float
     REQUEST_TIMEOUT: float
     PLAYER_CONFIGS: list[PlayerConfigType]
+    PREV_ATK_IDS_MAX_LEN: int = 10000
+    MAX_RETRY_COOLDOWN: float = 60
+    RETRY_WARNING_COUNT: int = 3
 
     def __init__(self, server_comm: ServerComm) -> None:
         self._server_comm = server_comm
@@ -28,7 +32,8 @@ class AttackListener:
         self._output_queue: asyncio.Queue[tuple[
             RoutingInfo, list[str],
         ]] = asyncio.Queue()
-        self._prev_atk_ids: set[int] = set()
+        # Used as an LRU set of recently seen attack ids
+        self._prev_atk_ids: OrderedDict[int, None] = OrderedDict()
 
         self._started = False
         self._tasks: set[asyncio.Task] = set()
@@ -49,32 +54,81 @@ class AttackListener:
         Start and initialize all listeners.
         """
         if not self._started:
-            for player_config in self.PLAYER_CONFIGS:
-                await self._setup_listener(player_config)
+            enabled_configs = [
+                player_config for player_config in self.PLAYER_CONFIGS
+                if player_config["services"]["attack_listener"]["enabled"]
+            ]
+            server_counts = Counter(
+                player_config["info"]["server"]
+                for player_config in enabled_configs
+            )
+            server_indices: Counter[str] = Counter()
+            for player_config in enabled_configs:
+                # Spread out requests of players on the same server
+                # across the cooldown instead of sending them together
+                server = player_config["info"]["server"]
+                start_delay = (
+                    self.REQUEST_COOLDOWN
+                    * server_indices[server] / server_counts[server]
+                )
+                server_indices[server] += 1
+
+                await self._setup_listener(player_config, start_delay)
 
             self._started = True
 
-    async def _setup_listener(self, config: PlayerConfigType) -> None:
+    async def _setup_listener(
+        self,
+        config: PlayerConfigType,
+        start_delay: float = 0,
+    ) -> None:
         """
         Initialize a listener based on its configuration.
 
         :param config: The configuration of the listener
         :type config: PlayerConfigType
+        :param start_delay: The time in seconds to wait before the
+            listener sends its first request
+        :type start_delay: float
         """
         player_info = config["info"]
         atk_listener_config = config["services"]["attack_listener"]
-        routes = config["visibility"]
+        # Immutable as it is shared by every dispatch
+        routes = tuple(config["visibility"])
         if not atk_listener_config["enabled"]:
             return
 
-        task = asyncio.create_task(self._listener(
-            username=player_info["username"],
-            password=player_info["password"],
-            server=player_info["server"],
-            routes=routes,
-        ))
+        task = asyncio.create_task(
+            self._listener(
+                username=player_info["username"],
+                password=player_info["password"],
+                server=player_info["server"],
+                routes=routes,
+                start_delay=start_delay,
+            ),
+            name=f"{player_info['username']}@{player_info['server']}",
+        )
         # Store a reference so that it won't be garbage collected
         self._tasks.add(task)
+        task.add_done_callback(self._on_listener_done)
+
+    def _on_listener_done(self, task: asyncio.Task) -> None:
+        """
+        Release a finished listener and report why it stopped.
+
+        :param task: The task running the listener
+        :type task: asyncio.Task
+        """
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+
+        exc = task.exception()
+        if exc is not None:
+            logger.error(
+                f"Attack listener {task.get_name()} stopped: {exc}",
+                exc_info=exc,
+            )
 
     async def _listener(
         self,
@@ -82,8 +136,17 @@ class AttackListener:
         username: str,
         password: str,
         server: str,
-        routes: list[int],
+        routes: tuple[int, ...],
+        start_delay: float = 0,
     ) -> None:
+        # Fixed for the listener, shared by all dispatches
+        routing_info: RoutingInfo = {
+            "username": username,
+            "server": server,
+            "routes": routes,
+        }
+
+        await asyncio.sleep(start_delay)
         index = await self._get_current_index(
             username=username,
             password=password,
@@ -114,9 +177,7 @@ class AttackListener:
                 atk_msgs.extend(self._encode_msg(msg))
 
             self._dispatch_atk_msgs(
-                username=username,
-                server=server,
-                routes=routes,
+                routing_info=routing_info,
                 atk_msgs=atk_msgs,
             )
 
@@ -127,6 +188,9 @@ class AttackListener:
         password: str,
         server: str,
     ) -> int:
+        cooldown = self.REQUEST_COOLDOWN
+        max_cooldown = max(self.REQUEST_COOLDOWN, self.MAX_RETRY_COOLDOWN)
+        failures = 0
         while True:
             index = await self._request_current_index(
                 username=username,
@@ -135,7 +199,20 @@ class AttackListener:
             )
             if index is not None:
                 return index
-            await asyncio.sleep(self.REQUEST_COOLDOWN)
+
+            failures += 1
+            if failures >= self.RETRY_WARNING_COUNT:
+                logger.warning(
+                    f"Failed to fetch current index of {username}@"
+                    f"{server} {failures} times, retrying in "
+                    f"{cooldown:.1f}s.",
+                )
+
+            # Exponential backoff with jitter to avoid retry storms
+            await asyncio.sleep(
+                cooldown + random.uniform(0, cooldown * 0.1),
+            )
+            cooldown = min(cooldown * 2, max_cooldown)
 
     async def _request_current_index(
         self,
@@ -169,7 +246,7 @@ class AttackListener:
             index = response["response"][1]
             if isinstance(index, int):
                 return index
-        except:
+        except (KeyError, IndexError, TypeError):
             return
 
     def _unpack_response(
@@ -184,21 +261,22 @@ class AttackListener:
         :return: The unpacked data if it is valid, None otherwise
         :rtype: tuple[list[str], int] | None
         """
-        if response is None:
-            return
-        if "error" in response:
-            return
         try:
-            # Enforce types
-            if not validate_type(
-                tuple(response["response"]),
-                tuple[list[str], int],
-            ):
-                return
-        except:
+            # Failed responses have no "response" field
+            msg_list, index = response["response"]
+        except (KeyError, TypeError, ValueError):
             return
 
-        return response["response"]
+        # Enforce types, the shape is fixed so a direct check is
+        # much cheaper than generic type validation
+        if not (
+            type(index) is int
+            and isinstance(msg_list, list)
+            and all(isinstance(msg, str) for msg in msg_list)
+        ):
+            return
+
+        return msg_list, index
 
     def _encode_msg(self, msg: str) -> list[str]:
         """
@@ -213,31 +291,36 @@ class AttackListener:
         if deserialized is None:
             return []
 
+        # Bind to locals to avoid repeated lookups in the loop
+        serialize = dp.AttackListener.serialize
+        prev_atk_ids = self._prev_atk_ids
+        max_len = self.PREV_ATK_IDS_MAX_LEN
+
         atk_msgs: list[str] = []
+        append = atk_msgs.append
         for atk_data in deserialized:
+            atk_id = atk_data["atk_id"]
             # Prevent duplicates
-            if atk_data["atk_id"] not in self._prev_atk_ids:
-                self._prev_atk_ids.add(atk_data["atk_id"])
-                atk_msgs.append(
-                    dp.AttackListener.serialize(atk_data),
-                )
+            if atk_id in prev_atk_ids:
+                prev_atk_ids.move_to_end(atk_id)
+                continue
+
+            prev_atk_ids[atk_id] = None
+            if len(prev_atk_ids) > max_len:
+                # Forget the least recently seen attack
+                prev_atk_ids.popitem(last=False)
+
+            append(serialize(atk_data))
         return atk_msgs
 
     def _dispatch_atk_msgs(
         self,
         *,
-        username: str,
-        server: str,
-        routes: list[int],
+        routing_info: RoutingInfo,
         atk_msgs: list[str],
     ) -> None:
         # Check if atk_msgs is empty
         if not atk_msgs:
             return
 
-        routing_info: RoutingInfo = {
-            "username": username,
-            "server": server,
-            "routes": routes,
-        }
         self._output_queue.put_nowait((routing_info, atk_msgs))
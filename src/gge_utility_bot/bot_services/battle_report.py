@@ -1,8 +1,9 @@
+import asyncio
 import io
 
 import numpy as np
 from PIL import Image
-from typing_extensions import Sequence, TypedDict
+from typing_extensions import TypedDict
 
 
 class AlignmentData(TypedDict):
@@ -27,11 +28,23 @@ class Aligner:
     DEFEAT_BANNER_COLOR = (193, 61, 10)
     COLOR_TOLERANCE = 4
 
+    # Signed so that differences with pixel values do not wrap
+    _VICTORY_BANNER_COLOR_ARR = np.array(
+        VICTORY_BANNER_COLOR, dtype=np.int16,
+    )
+    _DEFEAT_BANNER_COLOR_ARR = np.array(
+        DEFEAT_BANNER_COLOR, dtype=np.int16,
+    )
+
     SAMPLE_BANNER_WIDTH = 273
     SAMPLE_BANNER_HEIGHT = 41
     BANNER_RATIO = SAMPLE_BANNER_WIDTH / SAMPLE_BANNER_HEIGHT
     RATIO_TOLERANCE = 0.1  # 10%
 
+    # Images with fewer banner pixels are rejected early
+    MIN_BANNER_PIXELS = 256
+    PREVIEW_STRIDE = 4
+
     @classmethod
     def align(
         cls,
@@ -45,20 +58,41 @@ class Aligner:
         :return: Data for alignment
         :rtype: AlignmentData | None
         """
+        # Check a downsampled image first so that images without
+        # banners skip the full resolution processing
+        preview_mask = cls._get_banner_mask(
+            input_img_arr[::cls.PREVIEW_STRIDE, ::cls.PREVIEW_STRIDE],
+        )
+        if np.count_nonzero(preview_mask) < (
+            cls.MIN_BANNER_PIXELS // cls.PREVIEW_STRIDE ** 2
+        ):
+            return None
+
         banner_mask = cls._get_banner_mask(input_img_arr)
-        x_shifted, y_shifted = cls._shift_banner_mask(banner_mask)
+        not_banner_mask = ~banner_mask
 
         # Find pixels where on their right / bottom is a banner pixel
-        # while themselves are not.
-        x_enter = (~banner_mask) & x_shifted
-        y_enter = (~banner_mask) & y_shifted
-
-        corners = np.argwhere(
-            banner_mask & (~x_shifted) & (~y_shifted),
+        # while themselves are not. Pixels on the last column / row
+        # have nothing on their right / bottom.
+        x_enter = np.zeros_like(banner_mask)
+        np.logical_and(
+            not_banner_mask[:, :-1], banner_mask[:, 1:],
+            out=x_enter[:, :-1],
+        )
+        y_enter = np.zeros_like(banner_mask)
+        np.logical_and(
+            not_banner_mask[:-1, :], banner_mask[1:, :],
+            out=y_enter[:-1, :],
         )
 
+        # Banner pixels without banner pixels on their right / bottom
+        corner_mask = banner_mask.copy()
+        corner_mask[:, :-1] &= not_banner_mask[:, 1:]
+        corner_mask[:-1, :] &= not_banner_mask[1:, :]
+        corners_y, corners_x = np.nonzero(corner_mask)
+
         corner_data = cls._find_best_corner(
-            list(corners), x_enter, y_enter,
+            corners_x, corners_y, x_enter, y_enter,
         )
         if corner_data is None:
             return None
@@ -75,7 +109,8 @@ class Aligner:
     @classmethod
     def _find_best_corner(
         cls,
-        corners: Sequence[tuple[int, int]],
+        corners_x: np.ndarray,
+        corners_y: np.ndarray,
         x_enter: np.ndarray,
         y_enter: np.ndarray,
     ) -> CornerData | None:
@@ -83,8 +118,10 @@ class Aligner:
         Find the corner that is most likely the bottom-right corner
         of the banner.
 
-        :param corners: A sequence of corner coordinates
-        :type corners: Sequence[tuple[int, int]]
+        :param corners_x: The x positions of all corners
+        :type corners_x: np.ndarray
+        :param corners_y: The y positions of all corners
+        :type corners_y: np.ndarray
         :param x_enter: An array showing all "entries" from non-banner
             pixels to banner pixels horizontally
         :type x_enter: np.ndarray
@@ -96,35 +133,41 @@ class Aligner:
             sample.
         :rtype: CornerData | None
         """
-        # Select banner corner
-        dims_data: list[tuple[int, int, int, int]] = []
-        for y, x in corners:
-            # Get all pos that have the same x / y to the corner
-            x_enter_positions = np.nonzero(x_enter[y, :])[0]
-            y_enter_positions = np.nonzero(y_enter[:, x])[0]
-
-            # Find the nearest x pos west of the corner
-            x_enter_pos = np.max(
-                x_enter_positions[x_enter_positions < x],
-                initial=0,
-            )
-            # Find the nearest y pos north of the corner
-            y_enter_pos = np.max(
-                y_enter_positions[y_enter_positions < y],
-                initial=0,
-            )
-
-            width = x - int(x_enter_pos)
-            height = y - int(y_enter_pos)
-            dims_data.append((x, y, width, height))
+        if len(corners_x) == 0:
+            return None
+        height, width = x_enter.shape
 
-        # Find the most likely correct corner
-        corner_x, corner_y, w, h = min(
-            dims_data,
-            key=lambda data: abs(
-                data[2] / data[3] - cls.BANNER_RATIO,
-            )
+        # For every pixel, find the position of the nearest entry
+        # west / north of it (0 if there are none) with a prefix scan
+        x_enter_last = np.maximum.accumulate(
+            np.where(x_enter, np.arange(width, dtype=np.int32), 0),
+            axis=1,
         )
+        y_enter_last = np.maximum.accumulate(
+            np.where(
+                y_enter, np.arange(height, dtype=np.int32)[:, None], 0,
+            ),
+            axis=0,
+        )
+
+        # Corners are banner pixels, which are never entries
+        # themselves, so the nearest entry is always before them
+        widths = corners_x - x_enter_last[corners_y, corners_x]
+        heights = corners_y - y_enter_last[corners_y, corners_x]
+
+        # Find the most likely correct corner
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio_errors = np.abs(widths / heights - cls.BANNER_RATIO)
+        # Corners without height cannot be the banner
+        ratio_errors[heights == 0] = np.inf
+        best = int(np.argmin(ratio_errors))
+
+        corner_x = int(corners_x[best])
+        corner_y = int(corners_y[best])
+        w = int(widths[best])
+        h = int(heights[best])
+        if h == 0:
+            return None
 
         ratio = w / h
         # No match if the ratio exceeds tolerance
@@ -152,39 +195,20 @@ class Aligner:
             values are True, False otherwise
         :rtype: np.ndarray
         """
-        victory_diff = (
-            input_img_arr
-            - np.array(cls.VICTORY_BANNER_COLOR)[None, None, :]
-        ) % 256
-        defeat_diff = (
-            input_img_arr
-            - np.array(cls.DEFEAT_BANNER_COLOR)[None, None, :]
-        ) % 256
-
-        is_victory_banner = np.all(
-            (victory_diff <= cls.COLOR_TOLERANCE)
-            | (victory_diff >= 256 - cls.COLOR_TOLERANCE),
-            axis=2,
-        )
-        is_defeat_banner = np.all(
-            (defeat_diff <= cls.COLOR_TOLERANCE)
-            | (defeat_diff >= 256 - cls.COLOR_TOLERANCE),
-            axis=2,
-        )
+        img_arr = input_img_arr.astype(np.int16)
+
+        # Largest difference across color channels for each pixel
+        victory_diff = np.abs(
+            img_arr - cls._VICTORY_BANNER_COLOR_ARR,
+        ).max(axis=2)
+        defeat_diff = np.abs(
+            img_arr - cls._DEFEAT_BANNER_COLOR_ARR,
+        ).max(axis=2)
+
+        is_victory_banner = victory_diff <= cls.COLOR_TOLERANCE
+        is_defeat_banner = defeat_diff <= cls.COLOR_TOLERANCE
         return is_victory_banner | is_defeat_banner
 
-    @classmethod
-    def _shift_banner_mask(
-        cls,
-        banner_mask: np.ndarray,
-    ) -> tuple[np.ndarray, np.ndarray]:
-        x_shifted = np.zeros_like(banner_mask)
-        x_shifted[:, :-1] = banner_mask[:, 1:]
-        y_shifted = np.zeros_like(banner_mask)
-        y_shifted[:-1, :] = banner_mask[1:, :]
-
-        return x_shifted, y_shifted
-
 
 class Summarizer:
     OFFSETS = np.array([
@@ -193,7 +217,10 @@ class Summarizer:
         [-533, -44], [-413, 109],  # Info
         [-526, 363], [-391, 465],  # Left player
         [-197, 363], [-62, 465],  # Right player
-    ])
+    ], dtype=np.int32)
+    # Contiguous per-axis copies so each axis is positioned separately
+    _OFFSETS_X = np.ascontiguousarray(OFFSETS[:, 0])
+    _OFFSETS_Y = np.ascontiguousarray(OFFSETS[:, 1])
 
     @classmethod
     def generate_summary(
@@ -221,19 +248,14 @@ class Summarizer:
         :return: A summary of the battle report
         :rtype: SummaryResult
         """
-        box_pos_array = np.array(
-            cls.OFFSETS * scale + [align_x, align_y],
-            dtype=np.int16,
-        )
-        # Prevents negative index
-        box_pos_array = np.where(box_pos_array > 0, box_pos_array, 0)
         (
-            (date_x1, date_y1), (date_x2, date_y2),
-            (time_x1, time_y1), (time_x2, time_y2),
-            (info_x1, info_y1), (info_x2, info_y2),
-            (left_x1, left_y1), (left_x2, left_y2),
-            (right_x1, right_y1), (right_x2, right_y2),
-        ) = box_pos_array
+            date_x1, date_x2, time_x1, time_x2, info_x1, info_x2,
+            left_x1, left_x2, right_x1, right_x2,
+        ) = cls._get_positions(cls._OFFSETS_X, scale, align_x)
+        (
+            date_y1, date_y2, time_y1, time_y2, info_y1, info_y2,
+            left_y1, left_y2, right_y1, right_y2,
+        ) = cls._get_positions(cls._OFFSETS_Y, scale, align_y)
 
         # Get regions
         # These may be used in the future for additional features
@@ -259,6 +281,33 @@ class Summarizer:
             "summary_image": summary_img,
         }
 
+    @staticmethod
+    def _get_positions(
+        offsets: np.ndarray,
+        scale: float,
+        shift: int,
+    ) -> list[int]:
+        """
+        Converts offsets along one axis into pixel positions.
+
+        :param offsets: The offsets relative to the alignment point
+        :type offsets: np.ndarray
+        :param scale: The scale of the battle report relative to
+            the sample
+        :type scale: float
+        :param shift: The position of the alignment point on this axis
+        :type shift: int
+        :return: The positions, clamped to be non-negative
+        :rtype: list[int]
+        """
+        positions = offsets * scale
+        positions += shift
+        positions = positions.astype(np.int16)
+        # Prevents negative index
+        np.maximum(positions, 0, out=positions)
+        # Plain ints are cheaper to slice with than numpy scalars
+        return positions.tolist()
+
     @classmethod
     def _combine_imgs(
         cls,
@@ -296,13 +345,17 @@ class Summarizer:
             ),
             3,
         )
-        out_img = np.full(out_img_shape, bg_color, dtype=np.uint8)
+        # Every pixel is written below, no need to initialize
+        out_img = np.empty(out_img_shape, dtype=np.uint8)
         x1 = 0
         for img_arr in [left_img, middle_img, right_img]:
             x2 = x1 + img_arr.shape[1]
             y1 = int((out_img_shape[0] - img_arr.shape[0]) / 2)
             y2 = y1 + img_arr.shape[0]
             out_img[y1:y2, x1:x2, :] = img_arr
+            # Only fill the empty space above and below the image
+            out_img[:y1, x1:x2, :] = bg_color
+            out_img[y2:, x1:x2, :] = bg_color
             x1 = x2
 
         return out_img
@@ -311,6 +364,7 @@ class Summarizer:
 def summarize(img_buffer: io.BytesIO) -> io.BytesIO | None:
     """
     Generate a summary of a battle report.
+    Holds no shared state, so it is safe to call from any thread.
 
     :param img_buffer: A buffer containing image data of the 
         battle report
@@ -320,8 +374,11 @@ def summarize(img_buffer: io.BytesIO) -> io.BytesIO | None:
     :rtype: io.BytesIO | None
     """
     img = Image.open(img_buffer)
-    rgb_img = img.convert("RGB")
-    np_img = np.array(rgb_img)
+    # Converting always copies, even if the image is already RGB
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    # Read-only array, avoids the extra copy np.array makes
+    np_img = np.asarray(img)
 
     alignment_data = Aligner.align(np_img)
     if alignment_data is None:
@@ -338,8 +395,30 @@ def summarize(img_buffer: io.BytesIO) -> io.BytesIO | None:
     # Save image to buffer
     summary_img = Image.fromarray(summary_img_arr)
     summary_img_buffer = io.BytesIO()
-    summary_img.save(summary_img_buffer, format="PNG")
+    # Low compression since the summary is only for display,
+    # encoding speed matters more than file size
+    summary_img.save(
+        summary_img_buffer,
+        format="PNG",
+        compress_level=1,
+        optimize=False,
+    )
 
     # Move pointer back to the start
     summary_img_buffer.seek(0)
     return summary_img_buffer
+
+
+async def summarize_async(img_buffer: io.BytesIO) -> io.BytesIO | None:
+    """
+    Generate a summary of a battle report in a separate thread
+    to avoid blocking the event loop.
+
+    :param img_buffer: A buffer containing image data of the 
+        battle report
+    :type img_buffer: io.BytesIO
+    :return: A buffer containing image data of the summary if
+        the input image is a valid battle report, None otherwise
+    :rtype: io.BytesIO | None
+    """
+    return await asyncio.to_thread(summarize, img_buffer)
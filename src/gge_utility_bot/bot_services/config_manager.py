@@ -1,3 +1,7 @@
+import functools
+import operator
+import time
+
 from pymongo import AsyncMongoClient
 from typing_extensions import Any, TypedDict
 
@@ -40,6 +44,8 @@ class ConfigManager:
     class InvalidPathError(Exception):
         """Raised when an invalid path is received."""
 
+    CACHE_TTL = 2  # In seconds
+
     def __init__(
         self,
         db_client: AsyncMongoClient[dict[str, Any]],
@@ -52,6 +58,24 @@ class ConfigManager:
             self._database.get_collection("user-config")
         )
 
+        # Incremented on every write made through this manager
+        self._config_versions: dict[int, int] = {}
+        # Recently read values, stored as (value, expiry) by path
+        self._cache: dict[int, dict[str, tuple[Any, float]]] = {}
+
+    def get_version(self, guild_id: int) -> int:
+        """
+        Get the version of the configuration of the guild with the
+        given id. The version changes whenever the configuration is
+        modified through this manager.
+
+        :param guild_id: The id of the guild
+        :type guild_id: int
+        :return: The current version of the configuration
+        :rtype: int
+        """
+        return self._config_versions.get(guild_id, 0)
+
     async def get(self, guild_id: int, path: str) -> Any:
         """
         Read the value of a field specified by the given path,
@@ -71,36 +95,67 @@ class ConfigManager:
             if path != "":
                 raise self.InvalidPathError
 
+        guild_cache = self._cache.get(guild_id)
+        if guild_cache is not None and path in guild_cache:
+            value, expiry = guild_cache[path]
+            if time.monotonic() < expiry:
+                return value
+
+        # Writes made during the read must not be overwritten by
+        # the stale value
+        version = self.get_version(guild_id)
+        value = await self._read(guild_id, path)
+        if self.get_version(guild_id) == version:
+            self._cache.setdefault(guild_id, {})[path] = (
+                value, time.monotonic() + self.CACHE_TTL,
+            )
+        return value
+
+    async def _read(self, guild_id: int, path: str) -> Any:
+        """
+        Read the value of a field specified by the given path
+        from the database, bypassing the cache.
+
+        :param guild_id: The id of the guild
+        :type guild_id: int
+        :param path: The path to the field to be read from
+        :type path: str
+        :raises self.InvalidPathError: When the given path cannot
+            access any fields
+        :return: The value of the specified field
+        :rtype: Any
+        """
         # Matches if the path is valid for the specified guild
         if path != "":
-            pipeline = [
-                {"$match": {
-                    "_id": guild_id,
-                    path: {"$exists": True},
-                }},
-                {"$project": {"output": f"${path}"}},
-            ]
+            query = {"_id": guild_id, path: {"$exists": True}}
+            projection = {path: 1, "_id": 0}
         else:
             # path refers to the root path instead if empty
-            pipeline = [
-                {"$match": {
-                    "_id": guild_id,
-                }},
-                {"$project": {"_id": 0}},  # Remove _id field
-                {"$project": {"output": "$$ROOT"}},
-            ]
+            query = {"_id": guild_id}
+            projection = {"_id": 0}
 
         try:
-            async with (
-                await self._collection.aggregate(pipeline)
-            ) as cursor:
-                async for result in cursor:
-                    return result["output"]
-        except:  # AsyncCollection.aggregate may raise unknown errors
-            pass
+            result = await self._collection.find_one(
+                query, projection=projection,
+            )
+        except Exception:  # AsyncCollection.find_one may raise unknown errors
+            result = None
 
         # Raise exception if no result is found
-        raise self.InvalidPathError
+        if result is None:
+            raise self.InvalidPathError
+
+        if path == "":
+            return result
+
+        # The projection keeps the nesting of the path
+        try:
+            return functools.reduce(
+                operator.getitem, path.split("."), result,
+            )
+        except (KeyError, TypeError):
+            # Missing key or a non-dict along the path
+            raise self.InvalidPathError
 
     async def update(
         self,
@@ -130,8 +185,12 @@ class ConfigManager:
                 update={"$set": {path: value}},
                 upsert=True,
             )
-        except:
+        except Exception:
             return False
+        finally:
+            # Only after the write, reads made while it is in
+            # progress may still see the old value
+            self._bump_version(guild_id)
         return True
 
     async def delete(
@@ -157,10 +216,28 @@ class ConfigManager:
                 filter={"_id": guild_id},
                 update={"$unset": {path: ""}},
             )
-        except:
+        except Exception:
             return False
+        finally:
+            # Only after the write, reads made while it is in
+            # progress may still see the old value
+            self._bump_version(guild_id)
         return True
 
+    def _bump_version(self, guild_id: int) -> None:
+        """
+        Mark the configuration of the guild with the given id as
+        modified and drop its cached values.
+
+        :param guild_id: The id of the guild
+        :type guild_id: int
+        """
+        self._config_versions[guild_id] = (
+            self.get_version(guild_id) + 1
+        )
+        # Cached values may no longer be accurate
+        self._cache.pop(guild_id, None)
+
     def _validate_path(self, path: str) -> bool:
         """
         Validate the given path to ensure it is safe to pass
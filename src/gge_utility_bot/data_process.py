@@ -77,7 +77,7 @@ class AttackListener:
     ) -> list[UnpackedAttackDataType] | None:
         try:
             return cls._deserialize(message)
-        except:
+        except Exception:
             logger.debug(
                 "Failed to deserialize message from attack listener.",
                 exc_info=True,
@@ -102,7 +102,7 @@ class AttackListener:
                 unpacked = cls._unpack_atk_data(atk_data, players)
                 if unpacked is not None:
                     deserialized_atks.append(unpacked)
-            except:
+            except Exception:
                 continue
 
         return deserialized_atks
@@ -39,6 +39,7 @@ async def main() -> None:
     BOT_TOKEN = os.environ.get("BOT_TOKEN")
     DB_URI = os.environ.get("DB_URI")
     PORT = int(os.environ.get("PORT", 10000))
+    SEND_WORKERS = int(os.environ.get("SEND_WORKERS", 8))
 
     if (
         CONFIG_PATH is None
@@ -50,6 +51,10 @@ async def main() -> None:
             "Mandatory environment variables are missing. Exiting.",
         )
         return
+    if SEND_WORKERS < 1:
+        # Messages would never be sent without any workers
+        logging.critical("SEND_WORKERS must be at least 1. Exiting.")
+        return
 
     # Initialize modules
     config.init(CONFIG_PATH)
@@ -96,6 +101,7 @@ async def main() -> None:
         attack_listener=attack_listener,
         status_monitor=status_monitor,
         config_manager=config_manager,
+        send_workers=SEND_WORKERS,
     )
 
     await server_comm.start()
@@ -1,21 +1,21 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigGet:
     bad_channel: str
     bad_path: str
     success: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigRemove:
     bad_channel: str
     failed: str
     success: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigSet:
     bad_channel: str
     bad_input: str
@@ -23,29 +23,29 @@ class ConfigSet:
     success: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     get: ConfigGet
     remove: ConfigRemove
     set: ConfigSet
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PuppetStatus:
     success: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Puppet:
     status: PuppetStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BattleReport:
     summary: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Messages:
     battle_report: BattleReport
     config: Config
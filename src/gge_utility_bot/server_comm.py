@@ -197,7 +197,7 @@ class ServerComm:
 
             content = response_obj["content"]
             msg_id = response_obj["msg_id"]
-        except:
+        except Exception:
             return
 
         response_queue = self._response_register.get(str(msg_id))
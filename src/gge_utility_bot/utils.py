@@ -1,5 +1,7 @@
 import asyncio
+import functools
 import io
+import itertools
 import json
 
 import pydantic
@@ -15,6 +17,36 @@ from typing_extensions import (
 P = ParamSpec("P")
 
 
+def _serialize_fallback(_: Any) -> dict:
+    # Unserializable objects are displayed as empty dictionaries
+    return {}
+
+
+# Built once, json.dumps creates a new encoder on every call
+# when given any options
+_DISPLAY_ENCODER = json.JSONEncoder(
+    indent=2, default=_serialize_fallback,
+)
+_SORTED_DISPLAY_ENCODER = json.JSONEncoder(
+    indent=2, sort_keys=True, default=_serialize_fallback,
+)
+
+
+def serialize_as_display_bytes(
+    obj: Any,
+    sort_keys: bool,
+) -> bytes:
+    """
+    Serializes an object into its json counterpart for display,
+    uses a empty dictionary if the object is not serializable.
+
+    :return: The serialized object encoded in UTF-8
+    :rtype: bytes
+    """
+    encoder = _SORTED_DISPLAY_ENCODER if sort_keys else _DISPLAY_ENCODER
+    return encoder.encode(obj).encode("utf-8")
+
+
 def serialize_as_display_buffer(
     obj: Any,
     sort_keys: bool,
@@ -26,20 +58,14 @@ def serialize_as_display_buffer(
     :return: A BytesIO buffer of the serialized object
     :rtype: io.BytesIO
     """
-    json_bytes = json.dumps(
-        obj,
-        indent=2,
-        sort_keys=sort_keys,
-        default=lambda _: {},
-    ).encode("utf-8")
-    buffer = io.BytesIO(json_bytes)
-    return buffer
+    return io.BytesIO(serialize_as_display_bytes(obj, sort_keys))
 
 
+# The same durations are formatted repeatedly in attack warnings
+@functools.lru_cache(maxsize=4096)
 def as_compound_time(seconds: int) -> str:
-    h = seconds // 3600
-    m = (seconds // 60) % 60
-    s = seconds % 60
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
 
     if h != 0:
         return f"{h}h {m}m {s}s"
@@ -49,39 +75,78 @@ def as_compound_time(seconds: int) -> str:
         return f"{s}s"
 
 
+# Indexed by kingdom id
+_KINGDOM_NAMES = (
+    "The Great Empire",
+    "The Burning Sands",
+    "The Everwinter Glacier",
+    "The Fire Peaks",
+    "The Storm Islands",
+)
+
+
 def kid_to_name(kid: int) -> str | None:
-    name_map = {
-        0: "The Great Empire",
-        1: "The Burning Sands",
-        2: "The Everwinter Glacier",
-        3: "The Fire Peaks",
-        4: "The Storm Islands",
-    }
-    return name_map.get(kid)
+    # kid comes from unvalidated server data
+    if type(kid) is int and 0 <= kid < len(_KINGDOM_NAMES):
+        return _KINGDOM_NAMES[kid]
+    return None
+
+
+def _is_strict_int(obj: Any) -> bool:
+    # bool is a subclass of int but is rejected
+    return isinstance(obj, int) and not isinstance(obj, bool)
+
+
+def _is_str(obj: Any) -> bool:
+    return isinstance(obj, str)
+
+
+def _is_bool(obj: Any) -> bool:
+    return isinstance(obj, bool)
+
+
+def _is_bytes(obj: Any) -> bool:
+    return isinstance(obj, bytes)
+
+
+def _is_none(obj: Any) -> bool:
+    return obj is None
+
+
+# Types where an isinstance check gives the same result as
+# pydantic strict validation. float is left to pydantic since it
+# also accepts objects such as Decimal and numpy numbers.
+_PRIMITIVE_VALIDATORS: dict[Any, Callable[[Any], bool]] = {
+    int: _is_strict_int,
+    str: _is_str,
+    bool: _is_bool,
+    bytes: _is_bytes,
+    type(None): _is_none,
+    None: _is_none,
+}
 
 
 class _TypeValidator:
     CACHE_MAX_LEN: int = 1024
-    _cache_keys: list[Type] = []
-    _cache_items: list[pydantic.TypeAdapter] = []
+    # Insertion ordered, the oldest entry is removed first
+    _cache: dict[Type, pydantic.TypeAdapter] = {}
 
     @classmethod
     def validate_type(cls, obj: Any, obj_type: Type) -> bool:
-        try:
-            # Use cache
-            type_adapter = cls._cache_items[
-                cls._cache_keys.index(obj_type)
-            ]
-        except:
+        # Built-in scalar types are checked without pydantic
+        validator = _PRIMITIVE_VALIDATORS.get(obj_type)
+        if validator is not None:
+            return validator(obj)
+
+        type_adapter = cls._cache.get(obj_type)
+        if type_adapter is None:
             type_adapter = pydantic.TypeAdapter(obj_type)
             # Add to cache
-            cls._cache_keys.insert(0, obj_type)
-            cls._cache_items.insert(0, type_adapter)
+            cls._cache[obj_type] = type_adapter
 
             # Remove excess
-            if len(cls._cache_keys) > cls.CACHE_MAX_LEN:
-                cls._cache_keys.pop()
-                cls._cache_items.pop()
+            if len(cls._cache) > cls.CACHE_MAX_LEN:
+                del cls._cache[next(iter(cls._cache))]
 
         try:
             type_adapter.validate_python(
@@ -107,8 +172,10 @@ def validate_type(obj: Any, obj_type: Type) -> bool:
 
 
 class AsyncCallbackManager(Generic[P]):
+    __slots__ = ("_id_gen", "_callbacks")
+
     def __init__(self) -> None:
-        self._id = 0
+        self._id_gen = itertools.count()
         self._callbacks: dict[
             int,  Callable[P, Awaitable[None]],
         ] = {}
@@ -118,11 +185,29 @@ class AsyncCallbackManager(Generic[P]):
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> None:
+        """
+        Run all registered callbacks concurrently with the given
+        arguments. Exceptions raised by a callback do not affect
+        the other callbacks.
+        """
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        if len(callbacks) == 1:
+            # Nothing to run concurrently with, skip gather
+            callback, = callbacks.values()
+            try:
+                await callback(*args, **kwargs)
+            except Exception:
+                pass
+            return
+
+        # Unpacked straight into the argument tuple
         await asyncio.gather(
-            *[
+            *(
                 callback(*args, **kwargs)
-                for callback in self._callbacks.values()
-            ],
+                for callback in callbacks.values()
+            ),
             return_exceptions=True,
         )
 
@@ -139,6 +224,4 @@ class AsyncCallbackManager(Generic[P]):
             del self._callbacks[callback_id]
 
     def _new_id(self) -> int:
-        new_id = self._id
-        self._id += 1
-        return new_id
+        return next(self._id_gen)
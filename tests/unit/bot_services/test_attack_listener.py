@@ -97,15 +97,13 @@ async def test_listener(
             username="user",
             password="pwd123",
             server="server_1",
-            routes=[0, 1, 2],
+            routes=(0, 1, 2),
         )
 
-    output: list[tuple[RoutingInfo, list[str]]] = []
-    try:
-        while True:
-            output.append(attack_listener._output_queue.get_nowait())
-    except:
-        pass
+    output_queue = attack_listener._output_queue
+    output: list[tuple[RoutingInfo, list[str]]] = [
+        output_queue.get_nowait() for _ in range(output_queue.qsize())
+    ]
 
     assert len(output) == len(expected_output)
     for (routing_info, atk_msgs), expected_msgs in zip(
@@ -114,7 +112,7 @@ async def test_listener(
         assert routing_info == {
             "username": "user",
             "server": "server_1",
-            "routes": [0, 1, 2],
+            "routes": (0, 1, 2),
         }
         assert atk_msgs == expected_msgs
 
@@ -162,3 +160,144 @@ async def test_get_current_index(
 
     assert index == expected_value
     assert mock_send_request.await_count == expected_count
+
+
+@pytest.mark.parametrize(
+    "max_len, atk_id_batches, expected_output",
+    [
+        [10, [[1, 2], [2, 3], [1]], [[1, 2], [3], []]],
+        [2, [[1, 2], [3], [1]], [[1, 2], [3], [1]]],
+        [2, [[1, 2], [1], [3], [1]], [[1, 2], [], [3], []]],
+    ]
+)
+def test_encode_msg(
+    mocker: pytest_mock.MockFixture,
+    attack_listener: AttackListener,
+    max_len: int,
+    atk_id_batches: list[list[int]],
+    expected_output: list[list[int]],
+) -> None:
+    attack_listener.PREV_ATK_IDS_MAX_LEN = max_len
+    mocker.patch(
+        "gge_utility_bot.data_process.AttackListener.deserialize",
+        side_effect=[
+            [{"atk_id": atk_id} for atk_id in atk_ids]
+            for atk_ids in atk_id_batches
+        ],
+    )
+    mocker.patch(
+        "gge_utility_bot.data_process.AttackListener.serialize",
+        side_effect=lambda atk_data: atk_data["atk_id"],
+    )
+
+    output = [attack_listener._encode_msg("") for _ in atk_id_batches]
+
+    assert output == expected_output
+
+
+@pytest.mark.asyncio
+async def test_start_staggers_listeners(
+    mocker: pytest_mock.MockFixture,
+    attack_listener: AttackListener,
+) -> None:
+    def player_config(username: str, server: str, enabled: bool):
+        return {
+            "info": {
+                "server": server,
+                "username": username,
+                "password": "pwd123",
+            },
+            "services": {
+                "attack_listener": {"enabled": enabled},
+                "storm_searcher": {"enabled": False},
+            },
+            "visibility": [],
+        }
+
+    attack_listener.REQUEST_COOLDOWN = 6
+    attack_listener.PLAYER_CONFIGS = [
+        player_config("Alice", "server_1", True),
+        player_config("Bob", "server_1", False),
+        player_config("Carol", "server_2", True),
+        player_config("Dave", "server_1", True),
+        player_config("Eve", "server_1", True),
+    ]
+    mock_setup_listener = mocker.patch.object(
+        attack_listener,
+        "_setup_listener",
+        new_callable=mocker.AsyncMock,
+    )
+
+    await attack_listener.start()
+
+    start_delays = {
+        call.args[0]["info"]["username"]: call.args[1]
+        for call in mock_setup_listener.await_args_list
+    }
+    assert start_delays == {
+        "Alice": 0,
+        "Carol": 0,
+        "Dave": 2,
+        "Eve": 4,
+    }
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        [{"response": [["msg1", "msg2"], 4]}, (["msg1", "msg2"], 4)],
+        [{"response": [[], 0]}, ([], 0)],
+        [{"error": "UnknownError"}, None],
+        [None, None],
+        [{"response": None}, None],
+        [{"response": [["msg1"]]}, None],
+        [{"response": [["msg1"], 4, 5]}, None],
+        [{"response": [["msg1", 2], 4]}, None],
+        [{"response": [["msg1"], "4"]}, None],
+        [{"response": [["msg1"], True]}, None],
+        [{"response": ["msg1", 4]}, None],
+    ]
+)
+def test_unpack_response(
+    attack_listener: AttackListener,
+    response: ResponseContentType | None,
+    expected: tuple[list[str], int] | None,
+) -> None:
+    assert attack_listener._unpack_response(response) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_current_index_backoff(
+    mocker: pytest_mock.MockFixture,
+    attack_listener: AttackListener,
+) -> None:
+    attack_listener.REQUEST_COOLDOWN = 1
+    attack_listener.MAX_RETRY_COOLDOWN = 4
+
+    mock_sleep = mocker.patch(
+        "asyncio.sleep", new_callable=mocker.AsyncMock,
+    )
+    mocker.patch("random.uniform", return_value=0)
+    mocker.patch.object(
+        attack_listener._server_comm,
+        "send_request",
+        new_callable=mocker.AsyncMock,
+        side_effect=[
+            None,
+            {"error": "UnknownError"},
+            None,
+            None,
+            {"response": [["msg"], 3]},
+        ],
+    )
+
+    index = await attack_listener._get_current_index(
+        username="user",
+        password="pwd123",
+        server="server_1",
+    )
+
+    assert index == 3
+    assert [
+        call.args[0] for call in mock_sleep.await_args_list
+    ] == [1, 2, 4, 4]
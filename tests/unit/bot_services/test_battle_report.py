@@ -0,0 +1,73 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from gge_utility_bot.bot_services.battle_report import Aligner, summarize
+
+
+def banner_img(
+    banners: list[tuple[int, int, int, int, tuple[int, int, int]]],
+    height: int = 600,
+    width: int = 900,
+) -> np.ndarray:
+    # Dark background that never matches the banner colors
+    img = np.full((height, width, 3), 40, dtype=np.uint8)
+    for x, y, banner_width, banner_height, color in banners:
+        img[y:y + banner_height, x:x + banner_width] = color
+    return img
+
+
+@pytest.mark.parametrize(
+    "banners, expected",
+    [
+        [
+            [(600, 100, 273, 41, Aligner.VICTORY_BANNER_COLOR)],
+            {"x": 872, "y": 140, "scale": 1.0},
+        ],
+        [
+            [(300, 200, 546, 82, Aligner.DEFEAT_BANNER_COLOR)],
+            {"x": 845, "y": 281, "scale": 2.0},
+        ],
+        [
+            [
+                (10, 10, 40, 40, Aligner.DEFEAT_BANNER_COLOR),
+                (600, 100, 273, 41, Aligner.VICTORY_BANNER_COLOR),
+            ],
+            {"x": 872, "y": 140, "scale": 1.0},
+        ],
+        [
+            [(10, 10, 40, 40, Aligner.DEFEAT_BANNER_COLOR)],
+            None,
+        ],
+        [[], None],
+    ],
+)
+def test_align(
+    banners: list[tuple[int, int, int, int, tuple[int, int, int]]],
+    expected: dict | None,
+) -> None:
+    assert Aligner.align(banner_img(banners)) == expected
+
+
+@pytest.mark.parametrize("has_banner", [True, False])
+def test_summarize(has_banner: bool) -> None:
+    banners = (
+        [(600, 100, 273, 41, Aligner.VICTORY_BANNER_COLOR)]
+        if has_banner else []
+    )
+    img_buffer = io.BytesIO()
+    Image.fromarray(banner_img(banners)).save(img_buffer, format="PNG")
+    img_buffer.seek(0)
+
+    summary_buffer = summarize(img_buffer)
+
+    if not has_banner:
+        assert summary_buffer is None
+        return
+
+    assert summary_buffer is not None
+    summary_img = Image.open(summary_buffer)
+    assert summary_img.mode == "RGB"
+    assert summary_img.width > 0 and summary_img.height > 0
@@ -1,33 +1,13 @@
+import asyncio
+import time
+
 import pytest
 import pytest_mock
-from typing_extensions import Any, Literal, Self, Sequence
+from typing_extensions import Any
 
 from gge_utility_bot.bot_services.config_manager import ConfigManager
 
 
-class MockAsyncCommandCursor:
-    def __init__(self, outputs: Sequence[Any]) -> None:
-        self._outputs = outputs
-        self._index = 0
-
-    async def __aenter__(self) -> Self:
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb) -> None:
-        return
-
-    def __aiter__(self) -> Self:
-        return self
-
-    async def __anext__(self) -> dict[Literal["output"], Any]:
-        if self._index < len(self._outputs):
-            value = self._outputs[self._index]
-            self._index += 1
-            return {"output": value}
-        else:
-            raise StopAsyncIteration
-
-
 @pytest.fixture
 def config_manager(mocker: pytest_mock.MockFixture) -> ConfigManager:
     mock_AsyncMongoClient = mocker.patch(
@@ -40,44 +20,44 @@ def config_manager(mocker: pytest_mock.MockFixture) -> ConfigManager:
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "aggregate_outputs, path, is_valid_path",
+    "find_output, path, is_valid_path, expected",
     [
-        [[1, 2, 3], "abc", True],
-        [[4, 5, 6], "ab.c", True],
-        [[], "abcd.efg", True],
-        [[0, 7], "_id", False],
-        [[8, 9], "$abc.def", False],
+        [{"abc": 1}, "abc", True, 1],
+        [{"ab": {"c": 4}}, "ab.c", True, 4],
+        [{"x": 1}, "", True, {"x": 1}],
+        [None, "abcd.efg", True, None],
+        [{"ab": [1, 2]}, "ab.c", True, None],
+        [{"_id": 0}, "_id", False, 0],
+        [{"$abc": {"def": 8}}, "$abc.def", False, 8],
     ],
 )
 async def test_config_manager_get(
     mocker: pytest_mock.MockFixture,
     config_manager: ConfigManager,
-    aggregate_outputs: Sequence[Any],
+    find_output: dict[str, Any] | None,
     path: str,
     is_valid_path: bool,
+    expected: Any,
 ) -> None:
-    mocker.patch.object(
+    mock_find_one = mocker.patch.object(
         config_manager._collection,
-        "aggregate",
-        side_effect=lambda *args, **kwargs: (
-            MockAsyncCommandCursor(aggregate_outputs)
-        ),
+        "find_one",
+        return_value=find_output,
         new_callable=mocker.AsyncMock,
     )
-    if not aggregate_outputs:
-        # Expects error as the iterable will be empty which
-        # means no results received
+    if not is_valid_path:
+        # Expects error as it should not allow an invalid path,
+        # even though a value exists at the path
         with pytest.raises(ConfigManager.InvalidPathError):
             await config_manager.get(0, path)
-    elif not is_valid_path:
-        # Expects error as it should not allow an invalid path
+        mock_find_one.assert_not_awaited()
+    elif expected is None:
+        # Expects error as no value exists at the path
         with pytest.raises(ConfigManager.InvalidPathError):
             await config_manager.get(0, path)
     else:
-        # Expects the first result received by the function
-        # (from the iterable) to be returned
         result = await config_manager.get(0, path)
-        assert result == aggregate_outputs[0]
+        assert result == expected
 
 
 @pytest.mark.asyncio
@@ -144,3 +124,123 @@ async def test_config_manager_delete(
         assert result is False
     else:
         assert result is True
+
+
+@pytest.mark.asyncio
+async def test_config_manager_version(
+    mocker: pytest_mock.MockFixture,
+    config_manager: ConfigManager,
+) -> None:
+    mocker.patch.object(
+        config_manager._collection,
+        "update_one",
+        new_callable=mocker.AsyncMock,
+    )
+
+    assert config_manager.get_version(0) == 0
+
+    await config_manager.update(0, "abc", 1)
+    version = config_manager.get_version(0)
+    assert version != 0
+
+    await config_manager.delete(0, "abc")
+    assert config_manager.get_version(0) != version
+
+    # Invalid paths are not written
+    version = config_manager.get_version(0)
+    await config_manager.update(0, "_id", 1)
+    assert config_manager.get_version(0) == version
+
+    # Other guilds are not affected
+    assert config_manager.get_version(1) == 0
+
+
+@pytest.mark.asyncio
+async def test_config_manager_version_slow_write(
+    mocker: pytest_mock.MockFixture,
+    config_manager: ConfigManager,
+) -> None:
+    write_started = asyncio.Event()
+    finish_write = asyncio.Event()
+
+    async def slow_update_one(*args, **kwargs) -> None:
+        write_started.set()
+        await finish_write.wait()
+
+    mocker.patch.object(
+        config_manager._collection,
+        "update_one",
+        side_effect=slow_update_one,
+        new_callable=mocker.AsyncMock,
+    )
+
+    update_task = asyncio.create_task(config_manager.update(0, "abc", 2))
+    await write_started.wait()
+    # Read while the write is in progress
+    version = config_manager.get_version(0)
+
+    finish_write.set()
+    assert await update_task is True
+    # Results read during the write must be invalidated
+    assert config_manager.get_version(0) != version
+
+
+@pytest.mark.asyncio
+async def test_config_manager_get_cache(
+    mocker: pytest_mock.MockFixture,
+    config_manager: ConfigManager,
+) -> None:
+    mock_find_one = mocker.patch.object(
+        config_manager._collection,
+        "find_one",
+        return_value={"abc": 1, "def": 1},
+        new_callable=mocker.AsyncMock,
+    )
+    write_started = asyncio.Event()
+    finish_write = asyncio.Event()
+    finish_write.set()
+
+    async def slow_update_one(*args, **kwargs) -> None:
+        write_started.set()
+        await finish_write.wait()
+
+    mocker.patch.object(
+        config_manager._collection,
+        "update_one",
+        side_effect=slow_update_one,
+        new_callable=mocker.AsyncMock,
+    )
+
+    assert await config_manager.get(0, "abc") == 1
+    assert await config_manager.get(0, "abc") == 1
+    assert mock_find_one.await_count == 1
+
+    # Other guilds and paths are read separately
+    await config_manager.get(1, "abc")
+    await config_manager.get(0, "def")
+    assert mock_find_one.await_count == 3
+
+    # Writes invalidate the cached values of the guild
+    await config_manager.update(0, "xyz", 2)
+    await config_manager.get(0, "abc")
+    await config_manager.get(1, "abc")
+    assert mock_find_one.await_count == 4
+
+    # Values read while a write is in progress are not kept
+    write_started.clear()
+    finish_write.clear()
+    update_task = asyncio.create_task(config_manager.update(2, "abc", 2))
+    await write_started.wait()
+    assert await config_manager.get(2, "abc") == 1
+    mock_find_one.return_value = {"abc": 2}
+    finish_write.set()
+    assert await update_task is True
+    assert await config_manager.get(2, "abc") == 2
+
+    # Cached values expire
+    mocker.patch(
+        "time.monotonic",
+        return_value=time.monotonic() + ConfigManager.CACHE_TTL,
+    )
+    await config_manager.get(1, "abc")
+    assert mock_find_one.await_count == 7
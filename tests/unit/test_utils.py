@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import pytest
 from typing_extensions import Any, Type, TypedDict
 
@@ -16,6 +18,18 @@ def test_as_compound_time(seconds: int, expected: str) -> None:
     assert utils.as_compound_time(seconds) == expected
 
 
+@pytest.mark.parametrize("kid, expected", [
+    (0, "The Great Empire"),
+    (4, "The Storm Islands"),
+    (5, None),
+    (-1, None),
+    (None, None),
+    ("1", None),
+])
+def test_kid_to_name(kid: Any, expected: str | None) -> None:
+    assert utils.kid_to_name(kid) == expected
+
+
 class Inner(TypedDict):
     x: int
     y: float
@@ -43,6 +57,13 @@ class NestedDict(TypedDict):
         NestedDict,
         True,
     ),
+    (True, int, False),
+    (1, float, True),
+    (False, float, False),
+    (Decimal(1), float, True),
+    (b"", bytes, True),
+    (None, None, True),
+    (0, None, False),
     ("not int", int, False),
     ([1, "2", 3], list[int], False),
     (("x", "y", "z"), list[str], False),
@@ -78,3 +99,23 @@ def test_validate_type(
     expected: bool,
 ) -> None:
     assert utils.validate_type(obj, obj_type) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("callback_count", [0, 1, 3])
+async def test_async_callback_manager(callback_count: int) -> None:
+    manager: utils.AsyncCallbackManager[[int]] = (
+        utils.AsyncCallbackManager()
+    )
+    received = []
+
+    async def callback(value: int) -> None:
+        received.append(value)
+        raise Exception
+
+    for _ in range(callback_count):
+        manager.add_callback(callback)
+
+    # Exceptions raised by callbacks are not propagated
+    await manager.on_event(1)
+    assert received == [1] * callback_count